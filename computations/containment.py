@@ -0,0 +1,22 @@
+"""Point containment tests for convex volumes bounded by planes."""
+import numpy as np
+
+
+def contains_convex(points: np.ndarray, normals: np.ndarray, offsets: np.ndarray, tolerance: float = 1e-8) -> np.ndarray:
+    """
+    Checks which points lie inside a convex volume bounded by planes.
+
+    A point is inside if it lies on the inner side of every bounding plane, i.e. `normals @ point <= offsets`.
+
+    Args:
+        points (np.ndarray): Points to check, shape (N, 3).
+        normals (np.ndarray): Outward unit normals of the bounding planes, shape (F, 3).
+        offsets (np.ndarray): Offsets of the bounding planes along their normals, shape (F,).
+        tolerance (float): Distance outside the planes still considered inside.
+
+    Returns:
+        np.ndarray: Boolean mask of the points inside the volume, shape (N,).
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    return np.all(points @ normals.T <= offsets + tolerance, axis=1)
+
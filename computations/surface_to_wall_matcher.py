@@ -1,86 +1,88 @@
 import numpy as np
+from models.spatial_relations import WallIndex
 
 class SurfaceWallMatcher:
     """Handles the matching of analytical surfaces to architectural walls based on spatial proximity and containment logic."""
 
     @staticmethod
-    def spatial_proximity_filter(surface: 'AnalyticalSurface', walls: list['RevitWall']) -> list['RevitWall']:
+    def spatial_proximity_filter(surface: 'AnalyticalSurface', wall_index: WallIndex) -> np.ndarray:
         """
-        Filters out walls that are too high or low based on the z-coordinates of the surface.
+        Filters out walls whose buffered bounding box does not overlap the bounding box of the surface.
+
+        A wall can only contain points of the surface if the bounding boxes overlap, so walls too high, too low
+        or too far away in plan are discarded without inspecting their meshes.
 
         Args:
             surface (AnalyticalSurface): The analytical surface to check.
-            walls (list[RevitWall]): The list of walls to filter.
+            wall_index (WallIndex): The spatial index over the walls to filter.
 
         Returns:
-            list[RevitWall]: Filtered list of candidate walls for further inspection.
+            np.ndarray: Indices of the candidate walls for further inspection.
         """
-        filtered_walls = []
-        surface_min_z, surface_max_z = surface.bounds[0][2], surface.bounds[1][2]
+        return wall_index.query(surface.bounds)
 
-        for wall in walls:
-            wall_min_z, wall_max_z = wall.buffered_mesh.bounds[0][2], wall.buffered_mesh.bounds[1][2]
+    @staticmethod
+    def collect_points(surface: 'AnalyticalSurface', grid_max_distance) -> np.ndarray:
+        """
+        Collects the points of a surface to test for containment: its vertices and the generated interior grid.
 
-            # Check if the wall is within the z range of the surface
-            if not (surface_max_z < wall_min_z or surface_min_z > wall_max_z):
-                filtered_walls.append(wall)
+        Args:
+            surface (AnalyticalSurface): The surface to sample.
+            grid_max_distance (float): Maximum distance between the interior grid points.
 
-        return filtered_walls
+        Returns:
+            np.ndarray: Array of the points of the surface in 3D space.
+        """
+        surface.generate_grid(grid_max_distance)
+        if surface.interior_points.size == 0:
+            return surface.points
+        return np.vstack((surface.points, surface.interior_points))
 
     @staticmethod
     def is_surface_coordinated(surface: 'AnalyticalSurface', candidate_walls: list['RevitWall'], grid_max_distance) -> list[str]:
         """
         Checks if a surface is coordinated with any walls in the list of candidate walls.
+
+        Each point is credited to the first wall containing it, so every wall only tests the points not covered yet.
         
         Args:
             surface (AnalyticalSurface): The surface to check.
             candidate_walls (list[RevitWall]): List of walls to check against.
+            grid_max_distance (float): Maximum distance between the interior grid points.
 
         Returns:
             list[str]: List of wall IDs that the surface is coordinated with.
         """
         matching_wall_ids = []
 
-        # Combine vertices and interior points for the check
-        surface.generate_grid(grid_max_distance)
-        if surface.interior_points.size == 0:
-            all_points = surface.points
-        else:
-            all_points = np.vstack((surface.points, surface.interior_points))
-        remaining_points = all_points.copy()
+        # Combine vertices and interior points for the check, only the indices of the uncovered points shrink
+        all_points = SurfaceWallMatcher.collect_points(surface, grid_max_distance)
+        uncovered = np.arange(len(all_points))
 
         for wall in candidate_walls:
-            # Check if points are within this wall's mesh
-            points_contained = wall.buffered_mesh.contains(remaining_points)
-
-            if points_contained.all():
-                matching_wall_ids.append(wall.id)
-                return matching_wall_ids
+            # Check if the points not covered yet are within this wall's mesh
+            points_contained = wall.contains(all_points[uncovered])
 
             if points_contained.any():
-                new_remaining_points = remaining_points[~points_contained]       
-                remaining_points = new_remaining_points
                 matching_wall_ids.append(wall.id)
+                uncovered = uncovered[~points_contained]
 
-            if remaining_points.size == 0:
-                return matching_wall_ids
-
-        # If there are still remaining points after checking all walls, reset matching_wall_ids
-        if new_remaining_points.shape[0] > 0:
-            matching_wall_ids = []
-            return matching_wall_ids
+                if uncovered.size == 0:
+                    return matching_wall_ids
 
-        return matching_wall_ids
+        # If some points are not contained by any wall, the surface is not coordinated
+        return []
 
 
     @staticmethod
-    def find_matching_partners(surfaces: list['AnalyticalSurface'], walls: list['RevitWall'], grid_max_distance) -> dict:
+    def find_matching_partners(surfaces: list['AnalyticalSurface'], wall_index: WallIndex, grid_max_distance) -> dict:
         """
         Finds and matches analytical surfaces to architectural walls.
 
         Args:
             surfaces (list[AnalyticalSurface]): The list of analytical surfaces to check.
-            walls (list[RevitWall]): The list of walls to match against.
+            wall_index (WallIndex): The spatial index over the walls to match against.
+            grid_max_distance (float): Maximum distance between the interior grid points of the surfaces.
 
         Returns:
             dict: Mapping of surface IDs to the wall IDs they are coordinated with.
@@ -89,7 +91,7 @@ class SurfaceWallMatcher:
 
         for surface in surfaces:
             # Step 1: Filter the candidate walls based on spatial proximity
-            candidate_walls = SurfaceWallMatcher.spatial_proximity_filter(surface, walls)
+            candidate_walls = [wall_index.walls[i] for i in SurfaceWallMatcher.spatial_proximity_filter(surface, wall_index)]
 
             # Step 2: Check if the surface is coordinated with any candidate walls
             matching_wall_ids = SurfaceWallMatcher.is_surface_coordinated(surface, candidate_walls, grid_max_distance)
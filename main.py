@@ -2,7 +2,6 @@
 
 Use the automation_context module to wrap your function in an Automate context helper.
 """
-from enum import Enum
 from pydantic import Field
 from speckle_automate import (
     AutomateBase,
@@ -11,14 +10,10 @@ from speckle_automate import (
 )
 from models.etabs_model import EtabsModelProcessor
 from models.revit_model import RevitModelProcessor
+from models.spatial_relations import WallIndex
 from computations.surface_to_wall_matcher import SurfaceWallMatcher
 from utils.results_analyzer import analyze_dict
 
-class Units(Enum):
-    Metre = "m"
-    Centimetre = "cm"
-    Millimetre = "mm"
-
 class FunctionInputs(AutomateBase):
     """Author-defined function values.
     """
@@ -68,8 +63,11 @@ def automate_function(
     revit_processor = RevitModelProcessor(revit_model)
     architectural_walls = revit_processor.get_architectural_walls(function_inputs.buffer_size)
 
+    # Index the walls once so each surface only queries its neighbourhood
+    wall_index = WallIndex(architectural_walls)
+
     # Find matching partners
-    matches = SurfaceWallMatcher.find_matching_partners(analytical_surfaces, architectural_walls, function_inputs.grid_max_distance)
+    matches = SurfaceWallMatcher.find_matching_partners(analytical_surfaces, wall_index, function_inputs.grid_max_distance)
 
     # Calculate statistics
     results = analyze_dict(matches)
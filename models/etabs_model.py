@@ -1,26 +1,32 @@
 import numpy as np
 from speckle_automate import AutomationContext
-from utils.unit_converter import convert_units
+from utils.unit_converter import convert_units_array, get_scale_factor
 
 
 class AnalyticalSurface:
     """Represents analytical surfaces extracted from the ETABS model."""
     def __init__(self, points, surface_id):
-        self.points = np.array(points)
+        self.points = np.ascontiguousarray(points, dtype=np.float64)  # No copy for the arrays built by the model processor
         self.id = surface_id
-        self.bounds = np.array([np.min(points, axis=0), np.max(points, axis=0)])
+        self.bounds = np.stack((self.points.min(axis=0), self.points.max(axis=0)))
         self.interior_points = None
+        self._grid_max_distance = None  # Spacing of the grid currently stored in interior_points
 
     def generate_grid(self, max_distance = 0.5):
         """
         Generate a grid of points on the surface based on the maximum distance between points.
 
+        The grid is stored in `interior_points` and reused as long as the maximum distance does not change.
+
         Args:
             max_distance (float): Maximum distance between grid points.
 
         Returns:
             np.ndarray: Array of grid points on the surface in 3D space.
         """
+        if self._grid_max_distance == max_distance:
+            return self.interior_points
+
         # Step 1: Define the local 2D coordinate system
         v0, v1, v2, v3 = self.points
 
@@ -33,67 +39,57 @@ class AnalyticalSurface:
         v_vec = v_vec / np.linalg.norm(v_vec)
 
         # Step 2: Project vertices onto the local 2D plane (aligned to the surface)
-        # We will use (v0, u_vec, v_vec) as the base for a local coordinate system
-        def project_to_local_2d(point):
-            relative_point = point - v0
-            u_coord = np.dot(relative_point, u_vec)
-            v_coord = np.dot(relative_point, v_vec)
-            return np.array([u_coord, v_coord])
-
-        # Project all 4 vertices to the local 2D system
-        v0_2d = np.array([0, 0])
-        v1_2d = project_to_local_2d(v1)
-        v2_2d = project_to_local_2d(v2)
-        v3_2d = project_to_local_2d(v3)
+        # We will use (v0, u_vec, v_vec) as the base for a local coordinate system, all 4 vertices are projected at once
+        basis = np.stack((u_vec, v_vec), axis=1)
+        vertices_2d = (self.points - v0) @ basis
 
         # Step 3: Generate the grid in 2D space
         # Get the bounding box in 2D space
-        min_x = min(v0_2d[0], v1_2d[0], v2_2d[0], v3_2d[0])
-        max_x = max(v0_2d[0], v1_2d[0], v2_2d[0], v3_2d[0])
-        min_y = min(v0_2d[1], v1_2d[1], v2_2d[1], v3_2d[1])
-        max_y = max(v0_2d[1], v1_2d[1], v2_2d[1], v3_2d[1])
+        (min_x, min_y), (max_x, max_y) = vertices_2d.min(axis=0), vertices_2d.max(axis=0)
 
         # Create a grid of points within the bounding box
         x_coords = np.arange(min_x, max_x, max_distance)
         y_coords = np.arange(min_y, max_y, max_distance)
-        grid_2d = np.array([[x, y] for x in x_coords for y in y_coords])
+        x_grid, y_grid = np.meshgrid(x_coords, y_coords, indexing='ij')
 
-        # Step 4: Transform the grid back to 3D space
-        def transform_to_3d(point_2d):
-            return v0 + point_2d[0] * u_vec + point_2d[1] * v_vec
+        # Step 4: Transform the grid back to 3D space in a single broadcast
+        grid_3d = v0 + x_grid.reshape(-1, 1) * u_vec + y_grid.reshape(-1, 1) * v_vec
 
-        grid_3d = np.array([transform_to_3d(p) for p in grid_2d])
+        # A rectangle (the common case for walls) fills its bounding box in 2D space, so the whole grid is inside
+        is_rectangle = np.allclose(v2 - v1, v3 - v0, rtol=0, atol=1e-9) and abs(np.dot(u_vec, v_vec)) < 1e-9
+        if is_rectangle:
+            self.interior_points = grid_3d
+            self._grid_max_distance = max_distance
+            return self.interior_points
 
         # Step 5: Filter the points that are inside the quadrilateral (in 3D space)
-        def is_point_in_surface(point):
-            # Use barycentric coordinates to check if point is inside the quadrilateral
-            # Triangulate the quadrilateral into two triangles (v0, v1, v2) and (v0, v2, v3)
-            def point_in_triangle(pt, tri):
-                v0, v1, v2 = tri
-                u = v1 - v0
-                v = v2 - v0
-                w = pt - v0
-
-                u_dot_u = np.dot(u, u)
-                u_dot_v = np.dot(u, v)
-                u_dot_w = np.dot(u, w)
-                v_dot_v = np.dot(v, v)
-                v_dot_w = np.dot(v, w)
+        # Use barycentric coordinates to check if the points are inside the quadrilateral
+        # Triangulate the quadrilateral into two triangles (v0, v1, v2) and (v0, v2, v3)
+        # Both triangles share v0, so the products of the points with the three edges leaving v0 are computed once,
+        # one contiguous row per edge
+        edges = np.stack((v1 - v0, v2 - v0, v3 - v0))
+        edge_products = edges @ edges.T
+        point_products = edges @ (grid_3d - v0).T
 
-                denom = u_dot_u * v_dot_v - u_dot_v * u_dot_v
-                s_numer = u_dot_u * v_dot_w - u_dot_v * u_dot_w
-                t_numer = v_dot_v * u_dot_w - u_dot_v * v_dot_w
+        def points_in_triangle(u_edge, v_edge):
+            u_dot_u = edge_products[u_edge, u_edge]
+            u_dot_v = edge_products[u_edge, v_edge]
+            v_dot_v = edge_products[v_edge, v_edge]
+            u_dot_w = point_products[u_edge]
+            v_dot_w = point_products[v_edge]
 
-                s = s_numer / denom
-                t = t_numer / denom
+            denom = u_dot_u * v_dot_v - u_dot_v * u_dot_v
+            s = (u_dot_u * v_dot_w - u_dot_v * u_dot_w) / denom
+            t = (v_dot_v * u_dot_w - u_dot_v * v_dot_w) / denom
 
-                return (s >= 0) and (t >= 0) and (s + t <= 1)
+            return (s >= 0) & (t >= 0) & (s + t <= 1)
 
-            # Check both triangles
-            return point_in_triangle(point, [v0, v1, v2]) or point_in_triangle(point, [v0, v2, v3])
+        # Check both triangles and filter grid points to only include those inside the surface
+        inside = points_in_triangle(0, 1) | points_in_triangle(1, 2)
+        self.interior_points = grid_3d[inside]
+        self._grid_max_distance = max_distance
 
-        # Filter grid points to only include those inside the surface
-        self.interior_points = np.array([p for p in grid_3d if is_point_in_surface(p)])
+        return self.interior_points
 
 
 class EtabsModelProcessor:
@@ -101,6 +97,7 @@ class EtabsModelProcessor:
     def __init__(self, automate_context: AutomationContext):
         self.etabs_commit = automate_context.receive_version()
         self.units = None
+        self._floor_tol = 1e-5  # Largest z-extent of a surface considered a floor, in model units
 
     def validate_source(self):
         """Validate the ETABS source model."""
@@ -111,6 +108,7 @@ class EtabsModelProcessor:
             if getattr(model_element, "speckle_type", None) != "Objects.Structural.Analysis.Model":
                 return False
             self.units = self.get_model_units(model_element)
+            get_scale_factor(self.units)  # Fail early on unsupported units, before extracting any surface
         except KeyError:
             return False
         return True
@@ -126,40 +124,44 @@ class EtabsModelProcessor:
         """Extract analytical surfaces from the ETABS model."""
         elements = getattr(self.etabs_commit["@Model"], "elements", [])
         application_ids = set()
-        analytical_surfaces = [
-            surface
-            for element in elements
-            if "Element2D" in element.speckle_type
-            and element.applicationId not in application_ids
-            and not application_ids.add(element.applicationId)
-            and (surface := self.create_analytical_surface(element)) is not None
-        ]
+        analytical_surfaces = []
+
+        # Cheapest checks first: element type, then duplicates, only then build the surface
+        for element in elements:
+            # Each attribute of a Speckle object is read once into a local
+            if "Element2D" not in getattr(element, "speckle_type", ""):
+                continue
+            application_id = getattr(element, "applicationId", None)
+            if application_id in application_ids:
+                continue
+            application_ids.add(application_id)
+
+            surface = self.create_analytical_surface(element.displayValue[0].vertices, element.id)
+            if surface is not None:
+                analytical_surfaces.append(surface)
 
         return analytical_surfaces
 
-    def create_analytical_surface(self, surface) -> AnalyticalSurface:
-        """Create an AnalyticalSurface object from an element."""
-        vertices_array = np.array(surface.displayValue[0].vertices).reshape(-1, 3)
+    def create_analytical_surface(self, vertices, surface_id) -> AnalyticalSurface:
+        """Create an AnalyticalSurface object from the display mesh vertices and the ID of an element."""
+        # Speckle usually stores the vertices as a flat list, arrays already shaped (N, 3) are used as they are
+        vertices_array = np.asarray(vertices, dtype=np.float64)
+        if vertices_array.ndim == 1:
+            vertices_array = vertices_array.reshape(-1, 3)
 
-        # Check if the surface is a floor and skip it if so
+        # Check if the surface is a floor and skip it if so, before scaling: the z-extent of a floor is zero in any unit
         if self._is_floor(vertices_array):
             return None  # Skip this surface
 
         # Only apply scaling if units are not 'm'
-        if self.units in ['mm', 'cm']:
-            # Apply scaling function element-wise for each coordinate
-            scaling_factors = np.vectorize(lambda x: convert_units(x, self.units))
-            scaled_vertices_array = scaling_factors(vertices_array)
-        else:
-            scaled_vertices_array = vertices_array  # No scaling needed
+        scaled_vertices_array = convert_units_array(vertices_array, self.units)
 
-        return AnalyticalSurface(scaled_vertices_array, surface.id)
+        return AnalyticalSurface(scaled_vertices_array, surface_id)
 
-    @staticmethod
-    def _is_floor(vertices, tolerance=1e-5):
+    def _is_floor(self, vertices):
         """Check if the z-coordinates of the vertices are approximately the same."""
         z_coords = vertices[:, 2]
-        return np.ptp(z_coords) < tolerance
+        return z_coords.max() - z_coords.min() < self._floor_tol
 
     def process(self):
         """Validate and extract analytical surfaces from the ETABS model."""
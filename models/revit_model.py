@@ -5,6 +5,7 @@ from specklepy.objects import Base
 from specklepy.api.models import Branch
 from specklepy.transports.server import ServerTransport
 from specklepy.core.api import operations
+from computations.containment import contains_convex
 
 
 class RevitWall:
@@ -13,33 +14,49 @@ class RevitWall:
         self.mesh = mesh  # trimesh.Trimesh object
         self.id = wall_id
         self.buffered_mesh = self.create_buffered_mesh(buffer_distance)
+        self.bounds = self.buffered_mesh.bounds.copy()  # The buffered mesh is not modified after this point
 
-    def create_buffered_mesh(self, buffer_distance: float) -> trimesh.Trimesh:
-        """Create a slightly larger mesh by moving each vertex along its normal."""
-        # Ensure normals are calculated
-        if self.mesh.vertex_normals.size == 0:
-            self.mesh.compute_vertex_normals()
-        
-        # Create a copy of the vertices and normals
-        vertices = self.mesh.vertices.copy()
-        vertex_normals = self.mesh.vertex_normals.copy()
-
-        # Normalize the normals
-        norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
-        normalized_normals = vertex_normals / np.maximum(norms, 1e-10)  # Avoid division by zero
+        # Convex walls (no openings) are tested against their bounding planes instead of ray casting
+        if self.buffered_mesh.is_convex:
+            self.plane_normals, self.plane_offsets = self.extract_planes()
+        else:
+            self.plane_normals, self.plane_offsets = None, None
 
+    def create_buffered_mesh(self, buffer_distance: float) -> trimesh.Trimesh:
+        """Create a slightly larger mesh by moving each vertex along its normal, the wall mesh is expected to be watertight."""
         # Displace the vertices along the normal by the buffer_distance
-        buffered_vertices = vertices + buffer_distance * normalized_normals
+        # trimesh computes the vertex normals on first access and already returns them with unit length
+        buffered_vertices = self.mesh.vertices + buffer_distance * self.mesh.vertex_normals
 
         # Create a new mesh with the buffered vertices
-        buffered_mesh = trimesh.Trimesh(vertices=buffered_vertices, faces=self.mesh.faces, process=False)
+        # Offsetting the vertices keeps the connectivity, the buffered mesh is closed if the wall mesh is
+        return trimesh.Trimesh(vertices=buffered_vertices, faces=self.mesh.faces, process=False)
 
-        # Optionally, check for watertightness and repair if necessary
-        if not buffered_mesh.is_watertight:
-            buffered_mesh = buffered_mesh.repair()
+    def extract_planes(self) -> tuple[np.ndarray, np.ndarray]:
+        """Extract the outward normals and offsets of the planes bounding the buffered mesh, assuming it is convex."""
+        normals = self.buffered_mesh.face_normals
+        offsets = np.einsum('ij,ij->i', normals, self.buffered_mesh.triangles[:, 0])
+
+        # Coplanar faces (e.g. the two triangles of each side of a box) bound the same half-space
+        _, unique = np.unique(np.round(np.column_stack((normals, offsets)), 9), axis=0, return_index=True)
+        unique = np.sort(unique)
+
+        return np.ascontiguousarray(normals[unique]), np.ascontiguousarray(offsets[unique])
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """Check which points lie inside the buffered mesh."""
+        # Only the points inside the bounding box need the exact test
+        lower, upper = self.bounds
+        contained = np.all((points >= lower) & (points <= upper), axis=1)
+        if not contained.any():
+            return contained
+
+        if self.plane_normals is None:
+            contained[contained] = self.buffered_mesh.contains(points[contained])
+        else:
+            contained[contained] = contains_convex(points[contained], self.plane_normals, self.plane_offsets)
+        return contained
 
-        return buffered_mesh
-        
 
 class RevitModelProcessor:
     """Responsible for processing the Revit model and extracting architectural walls."""
@@ -68,12 +85,11 @@ class RevitModelProcessor:
                     if not self._is_valid_wall(wall):
                         continue
 
-                    faces = wall.displayValue[0].faces
-                    vertices = wall.displayValue[0].vertices
+                    display_mesh = wall.displayValue[0]
 
-                    # Prepare the mesh
-                    faces_indices = np.array(faces).reshape(-1, 4)[:, 1:]
-                    vertices = np.array(vertices).reshape(-1, 3)
+                    # Prepare the mesh, converting the flat Speckle lists with their final dtype in one go
+                    faces_indices = np.asarray(display_mesh.faces, dtype=np.int64).reshape(-1, 4)[:, 1:]
+                    vertices = np.asarray(display_mesh.vertices, dtype=np.float64).reshape(-1, 3)
                     mesh = trimesh.Trimesh(vertices=vertices, faces=faces_indices)
 
                     # Create RevitWall instance
@@ -0,0 +1,34 @@
+import numpy as np
+
+
+class WallIndex:
+    """Spatial index over the buffered meshes of the architectural walls, built once and shared by all surface queries."""
+    def __init__(self, walls: list['RevitWall']):
+        self.walls = walls
+        bounds = np.stack([wall.bounds for wall in walls]) if walls else np.empty((0, 2, 3))  # (W, 2, 3)
+
+        # Sort the walls by their lower z-bound so a query only scans the walls starting below the top of the surface.
+        # The corners are kept as separate contiguous arrays in that order, a query then works on views only.
+        self._z_order = np.argsort(bounds[:, 0, 2], kind='stable')
+        self._lower = np.ascontiguousarray(bounds[self._z_order, 0])
+        self._upper = np.ascontiguousarray(bounds[self._z_order, 1])
+        self._sorted_min_z = np.ascontiguousarray(self._lower[:, 2])
+
+    def query(self, bounds: np.ndarray) -> np.ndarray:
+        """
+        Finds the walls whose bounding boxes overlap the given bounding box.
+
+        Args:
+            bounds (np.ndarray): Lower and upper corner of the bounding box to check, shape (2, 3).
+
+        Returns:
+            np.ndarray: Indices of the overlapping walls, in the order of the walls given to the index.
+        """
+        query_lower, query_upper = bounds
+        stop = np.searchsorted(self._sorted_min_z, query_upper[2], side='right')
+
+        # Vectorized overlap test on all three axes for the remaining walls
+        overlap = np.all((self._lower[:stop] <= query_upper) & (self._upper[:stop] >= query_lower), axis=1)
+
+        # The matching credits each point to the first wall containing it, so the walls keep their original order
+        return np.sort(self._z_order[:stop][overlap])
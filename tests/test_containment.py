@@ -0,0 +1,70 @@
+"""Unit tests for the point containment tests of the buffered wall meshes."""
+
+import numpy as np
+import pytest
+import trimesh
+
+from computations.containment import contains_convex
+from models.revit_model import RevitWall
+
+EXTENTS = np.array([5.0, 0.2, 4.0])
+BUFFER_DISTANCE = 0.01
+
+
+def box_transform(angle):
+    """Rotate a box about the z-axis and move it away from the origin."""
+    transform = trimesh.transformations.rotation_matrix(angle, [0, 0, 1])
+    transform[:3, 3] = [120.0, -35.0, 8.0]
+    return transform
+
+
+def sample_points(transform, margin, num_points=5000, seed=0):
+    """Sample points around a transformed box, excluding those closer than the margin to its sides."""
+    rng = np.random.default_rng(seed)
+    local = rng.uniform(-EXTENTS / 2 - 2 * margin, EXTENTS / 2 + 2 * margin, (num_points, 3))
+    local = local[np.all(np.abs(np.abs(local) - EXTENTS / 2) > margin, axis=1)]
+    return trimesh.transform_points(local, transform)
+
+
+@pytest.mark.parametrize("angle", [0.0, np.pi / 2, 0.3, 2.1])
+def test_convex_wall_matches_mesh_containment(angle):
+    """The plane test of a box wall agrees with the ray test of its buffered mesh away from the sides."""
+    transform = box_transform(angle)
+    wall = RevitWall(trimesh.creation.box(extents=EXTENTS, transform=transform), "w", BUFFER_DISTANCE)
+    points = sample_points(transform, margin=0.05)
+
+    assert wall.plane_normals is not None
+    expected = wall.buffered_mesh.contains(points)
+    assert expected.any() and not expected.all()
+    np.testing.assert_array_equal(wall.contains(points), expected)
+    np.testing.assert_array_equal(contains_convex(points, wall.plane_normals, wall.plane_offsets), expected)
+
+
+def test_convex_wall_planes_are_deduplicated():
+    """The two triangles of each side of a box wall bound the same half-space."""
+    wall = RevitWall(trimesh.creation.box(extents=EXTENTS, transform=box_transform(0.3)), "w", BUFFER_DISTANCE)
+
+    assert len(wall.plane_offsets) == 6
+
+
+def test_wall_with_opening_matches_mesh_containment():
+    """A wall with an opening is not convex and falls back to the ray test of its buffered mesh."""
+    parts = []
+    for extents, centre in [((1.5, 0.2, 4.0), (-1.75, 0, 0)), ((1.5, 0.2, 4.0), (1.75, 0, 0)),
+                            ((1.996, 0.2, 1.0), (0, 0, -1.5)), ((1.996, 0.2, 1.0), (0, 0, 1.5))]:
+        parts.append(trimesh.creation.box(extents=extents, transform=trimesh.transformations.translation_matrix(centre)))
+    mesh = trimesh.util.concatenate(parts)
+    wall = RevitWall(trimesh.Trimesh(vertices=mesh.vertices, faces=mesh.faces), "w", BUFFER_DISTANCE)
+    points = np.array([[-1.75, 0, 0], [1.75, 0, 0], [0, 0, 1.5], [0, 0, 0], [0, 0.5, 0], [3.0, 0, 0]])
+
+    assert wall.plane_normals is None
+    np.testing.assert_array_equal(wall.contains(points), [True, True, True, False, False, False])
+
+
+def test_contains_convex_tolerance():
+    """Points on the planes are inside, points just beyond the tolerance are outside."""
+    normals = np.array([[1.0, 0, 0], [-1.0, 0, 0]])
+    offsets = np.array([1.0, 0.0])
+    points = np.array([[1.0, 0, 0], [1.0 + 5e-9, 0, 0], [1.0 + 2e-8, 0, 0], [0.5, 0, 0]])
+
+    np.testing.assert_array_equal(contains_convex(points, normals, offsets), [True, True, False, True])
@@ -0,0 +1,91 @@
+"""Unit tests for the analytical surfaces of the ETABS model."""
+
+import numpy as np
+import pytest
+import trimesh
+
+from models.etabs_model import AnalyticalSurface
+
+GRID_MAX_DISTANCE = 0.3
+EDGE_TOLERANCE = 1e-9
+
+
+def place(points_2d, seed):
+    """Place a quadrilateral drawn in the xz-plane at a random position and orientation in 3D space."""
+    rng = np.random.default_rng(seed)
+    points = np.column_stack((points_2d[:, 0], np.zeros(len(points_2d)), points_2d[:, 1]))
+    transform = trimesh.transformations.random_rotation_matrix(rng.random(3))
+    transform[:3, 3] = rng.uniform(-100, 100, 3)
+    return trimesh.transform_points(points, transform)
+
+
+def reference_grid(points, max_distance):
+    """Build the candidate grid of a surface point by point, with the signed distance of each point to the edges."""
+    v0, v1, _, v3 = points
+    u_vec = (v1 - v0) / np.linalg.norm(v1 - v0)
+    v_vec = (v3 - v0) / np.linalg.norm(v3 - v0)
+    local_2d = np.array([[np.dot(point - v0, u_vec), np.dot(point - v0, v_vec)] for point in points])
+    x_coords = np.arange(local_2d[:, 0].min(), local_2d[:, 0].max(), max_distance)
+    y_coords = np.arange(local_2d[:, 1].min(), local_2d[:, 1].max(), max_distance)
+    grid = np.array([v0 + x * u_vec + y * v_vec for x in x_coords for y in y_coords])
+
+    # Signed distance to the closest edge of the convex quadrilateral, positive inside
+    normal = np.cross(points[1] - points[0], points[3] - points[0])
+    normal /= np.linalg.norm(normal)
+    distances = []
+    for start, end in zip(points, np.roll(points, -1, axis=0)):
+        inward = np.cross(normal, end - start)
+        inward /= np.linalg.norm(inward)
+        distances.append((grid - start) @ inward)
+    return grid, np.min(distances, axis=0)
+
+
+def assert_grid_matches_reference(surface):
+    """The grid holds every candidate point inside the surface and none outside, points on an edge may go either way."""
+    candidates, distances = reference_grid(surface.points, GRID_MAX_DISTANCE)
+    grid = surface.generate_grid(GRID_MAX_DISTANCE)
+
+    is_candidate = [np.any(np.all(candidates == point, axis=1)) for point in grid]
+    assert all(is_candidate)
+    kept = {tuple(point) for point in grid}
+    for point, distance in zip(candidates, distances):
+        if distance > EDGE_TOLERANCE:
+            assert tuple(point) in kept
+        elif distance < -EDGE_TOLERANCE:
+            assert tuple(point) not in kept
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grid_of_rectangle(seed):
+    """The grid of a rectangle holds the candidate points inside it."""
+    surface = AnalyticalSurface(place(np.array([[0, 0], [6.2, 0], [6.2, 3.1], [0, 3.1]]), seed), "s")
+
+    assert_grid_matches_reference(surface)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grid_of_rectangle_keeps_edge_points(seed):
+    """A rectangle keeps its whole candidate grid, including the points lying on its edges such as the v0-v3 edge."""
+    surface = AnalyticalSurface(place(np.array([[0, 0], [6.2, 0], [6.2, 3.1], [0, 3.1]]), seed), "s")
+    candidates, distances = reference_grid(surface.points, GRID_MAX_DISTANCE)
+
+    np.testing.assert_array_equal(surface.generate_grid(GRID_MAX_DISTANCE), candidates)
+    assert np.any(np.abs(distances) <= EDGE_TOLERANCE)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grid_of_trapezoid(seed):
+    """The grid of a trapezoid holds the candidate points inside it, its bounding box is only partly covered."""
+    surface = AnalyticalSurface(place(np.array([[0, 0], [6.2, 0], [4.5, 3.1], [1.0, 3.1]]), seed), "s")
+
+    assert_grid_matches_reference(surface)
+    assert len(surface.interior_points) < len(reference_grid(surface.points, GRID_MAX_DISTANCE)[0])
+
+
+def test_grid_is_cached_per_distance():
+    """The grid is only regenerated when the maximum distance changes."""
+    surface = AnalyticalSurface(np.array([[0, 0, 0], [2, 0, 0], [2, 0, 2], [0, 0, 2]], dtype=float), "s")
+    grid = surface.generate_grid(0.5)
+
+    assert surface.generate_grid(0.5) is grid
+    assert len(surface.generate_grid(0.25)) == 64
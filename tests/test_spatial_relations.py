@@ -0,0 +1,44 @@
+"""Unit tests for the spatial index over the architectural walls."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from models.spatial_relations import WallIndex
+
+
+def random_boxes(num_boxes, rng):
+    """Create random axis-aligned boxes, shape (N, 2, 3)."""
+    lower = rng.uniform(0, 50, (num_boxes, 3))
+    return np.stack((lower, lower + rng.uniform(0.1, 10, (num_boxes, 3))), axis=1)
+
+
+def test_query_matches_brute_force_overlap():
+    """The query returns exactly the walls whose boxes overlap the given box, in the order of the walls."""
+    rng = np.random.default_rng(0)
+    wall_bounds = random_boxes(300, rng)
+    wall_index = WallIndex([SimpleNamespace(bounds=bounds) for bounds in wall_bounds])
+
+    for query_bounds in random_boxes(200, rng):
+        overlap = np.all((wall_bounds[:, 0] <= query_bounds[1]) & (wall_bounds[:, 1] >= query_bounds[0]), axis=1)
+        np.testing.assert_array_equal(wall_index.query(query_bounds), np.flatnonzero(overlap))
+
+
+def test_query_touching_and_flat_boxes():
+    """Boxes touching the given box overlap it, also when the given box is flat."""
+    wall_bounds = np.array([
+        [[0, 0, 0], [5, 1, 4]],
+        [[5, 0, 0], [10, 1, 4]],
+        [[0, 0, 4], [5, 1, 8]],
+        [[0, 2, 0], [5, 3, 4]],
+    ], dtype=float)
+    wall_index = WallIndex([SimpleNamespace(bounds=bounds) for bounds in wall_bounds])
+
+    np.testing.assert_array_equal(wall_index.query(np.array([[1, 0.5, 4], [4, 0.5, 4]])), [0, 2])
+    np.testing.assert_array_equal(wall_index.query(np.array([[5, 0.5, 1], [5, 0.5, 3]])), [0, 1])
+    np.testing.assert_array_equal(wall_index.query(np.array([[20, 20, 20], [21, 21, 21]])), [])
+
+
+def test_query_without_walls():
+    """An index over no walls finds no overlapping walls."""
+    np.testing.assert_array_equal(WallIndex([]).query(np.array([[0, 0, 0], [1, 1, 1]], dtype=float)), [])
@@ -0,0 +1,71 @@
+"""Unit tests for the matching of analytical surfaces to architectural walls."""
+
+import numpy as np
+import trimesh
+
+from computations.surface_to_wall_matcher import SurfaceWallMatcher
+from models.etabs_model import AnalyticalSurface
+from models.revit_model import RevitWall
+from models.spatial_relations import WallIndex
+
+WALL_LENGTH = 5.0
+WALL_HEIGHT = 4.0
+WALL_THICKNESS = 0.2
+BUFFER_DISTANCE = 0.01
+GRID_MAX_DISTANCE = 0.5
+
+
+def box_wall(wall_id, start_x, level):
+    """Create a straight box wall along the x-axis, starting at start_x on the given level."""
+    mesh = trimesh.creation.box(extents=(WALL_LENGTH, WALL_THICKNESS, WALL_HEIGHT))
+    mesh.apply_translation((start_x + WALL_LENGTH / 2, 0, level * WALL_HEIGHT + WALL_HEIGHT / 2))
+    return RevitWall(mesh, wall_id, BUFFER_DISTANCE)
+
+
+def stacked_walls(num_levels=2, walls_per_level=5):
+    """Create levels of walls placed end to end along the x-axis, numbered level by level."""
+    return [
+        box_wall(f"w{level * walls_per_level + i}", i * WALL_LENGTH, level)
+        for level in range(num_levels)
+        for i in range(walls_per_level)
+    ]
+
+
+def rectangle_surface(surface_id, start_x, end_x, bottom_z, top_z):
+    """Create a vertical rectangular surface on the midplane of the walls."""
+    points = [[start_x, 0, bottom_z], [end_x, 0, bottom_z], [end_x, 0, top_z], [start_x, 0, top_z]]
+    return AnalyticalSurface(np.array(points, dtype=float), surface_id)
+
+
+def match(surfaces, walls):
+    """Match the surfaces to the walls through a freshly built wall index."""
+    return SurfaceWallMatcher.find_matching_partners(surfaces, WallIndex(walls), GRID_MAX_DISTANCE)
+
+
+def test_points_credited_to_first_wall_in_model_order():
+    """The bottom edge of an upper-level surface lies within the buffer of the walls below and credits them first."""
+    surface = rectangle_surface("s", WALL_LENGTH + 0.5, 3 * WALL_LENGTH - 0.5, WALL_HEIGHT, 2 * WALL_HEIGHT)
+
+    assert match([surface], stacked_walls()) == {"s": ["w1", "w2", "w6", "w7"]}
+
+
+def test_surface_within_one_wall():
+    """A surface inside a single wall is matched to that wall only."""
+    surface = rectangle_surface("s", WALL_LENGTH + 0.5, 2 * WALL_LENGTH - 0.5, 0.5, WALL_HEIGHT - 0.5)
+
+    assert match([surface], stacked_walls()) == {"s": ["w1"]}
+
+
+def test_surface_partly_outside_walls():
+    """A surface sticking out of the walls is not coordinated."""
+    surface = rectangle_surface("s", -1.0, WALL_LENGTH - 0.5, 0.5, WALL_HEIGHT - 0.5)
+
+    assert match([surface], stacked_walls()) == {"s": []}
+
+
+def test_surface_without_candidate_walls():
+    """A surface far away from all walls has no candidates and is not coordinated."""
+    surface = rectangle_surface("s", 100.0, 105.0, 0.5, WALL_HEIGHT - 0.5)
+
+    assert match([surface], stacked_walls()) == {"s": []}
+    assert SurfaceWallMatcher.is_surface_coordinated(surface, [], GRID_MAX_DISTANCE) == []
@@ -0,0 +1,21 @@
+"""Unit tests for the conversion of model units to metres."""
+
+import numpy as np
+import pytest
+
+from utils.unit_converter import convert_units_array
+
+
+def test_convert_units_array_scales_to_metres():
+    """Values in millimetres and centimetres are scaled, values in metres are returned as they are."""
+    values = np.array([[1000.0, 2500.0, 0.0]])
+
+    np.testing.assert_allclose(convert_units_array(values, 'mm'), [[1.0, 2.5, 0.0]])
+    np.testing.assert_allclose(convert_units_array(values, 'cm'), [[10.0, 25.0, 0.0]])
+    assert convert_units_array(values, 'm') is values
+
+
+def test_convert_units_array_rejects_unknown_units():
+    """Unsupported units raise a ValueError."""
+    with pytest.raises(ValueError, match="'ft' not recognized"):
+        convert_units_array(np.zeros((1, 3)), 'ft')
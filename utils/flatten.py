@@ -5,14 +5,6 @@ from specklepy.objects import Base
 from specklepy.objects.other import Instance, Transform
 
 
-# def flatten_base(base: Base) -> Iterable[Base]:
-#     """Take a base and flatten it to an iterable of bases."""
-#     if hasattr(base, "elements") and base["elements"] is not None:
-#         for element in base["elements"]:
-#             yield from flatten_base(element)
-#     yield base
-
-
 def extract_base_and_transform(
     base: Base,
     inherited_instance_id: Optional[str] = None,
@@ -1,3 +1,7 @@
+# Category of the lists with fewer than 4 items, keyed by their length
+_LENGTH_CATEGORIES = {0: 'empty_lists', 1: 'lists_with_1_item', 2: 'lists_between_2_and_3', 3: 'lists_between_2_and_3'}
+
+
 def analyze_dict(d):
     """
     Analyzes a dictionary where the values are lists, and categorizes the lists 
@@ -18,38 +22,10 @@ def analyze_dict(d):
             - 'lists_with_1_item': Contains a count of lists with exactly 1 item and their keys.
     """
 
-    # Initialize counters and lists for each condition
-    empty_count = 0
-    empty_keys = []
-
-    greater_than_3_count = 0
-    greater_than_3_keys = []
-
-    between_2_and_3_count = 0
-    between_2_and_3_keys = []
-
-    length_1_count = 0
-    length_1_keys = []
-
-    # Iterate through the dictionary
+    # Bucket the keys by the length of their list in a single pass
+    buckets = {'empty_lists': [], 'lists_greater_than_3': [], 'lists_between_2_and_3': [], 'lists_with_1_item': []}
     for key, value in d.items():
-        if not value:  # Check for empty list
-            empty_count += 1
-            empty_keys.append(key)
-        elif len(value) > 3:  # Check if length > 3
-            greater_than_3_count += 1
-            greater_than_3_keys.append(key)
-        elif 2 <= len(value) <= 3:  # Check if length is 2 or 3
-            between_2_and_3_count += 1
-            between_2_and_3_keys.append(key)
-        elif len(value) == 1:  # Check if length is 1
-            length_1_count += 1
-            length_1_keys.append(key)
-    
+        buckets[_LENGTH_CATEGORIES.get(len(value), 'lists_greater_than_3')].append(key)
+
     # Return the results in a dictionary
-    return {
-        'empty_lists': {'count': empty_count, 'keys': empty_keys},
-        'lists_greater_than_3': {'count': greater_than_3_count, 'keys': greater_than_3_keys},
-        'lists_between_2_and_3': {'count': between_2_and_3_count, 'keys': between_2_and_3_keys},
-        'lists_with_1_item': {'count': length_1_count, 'keys': length_1_keys}
-    }
+    return {category: {'count': len(keys), 'keys': keys} for category, keys in buckets.items()}
@@ -1,10 +1,18 @@
-def convert_units(value, units):
-    """Convert the value based on the units provided."""
-    if units == 'mm':
-        return value / 1000.0
-    elif units == 'cm':
-        return value / 100.0
-    elif units == 'm':
-        return value
-    else:
-        raise ValueError(f"Units '{units}' not recognized. Supported units are 'mm', 'cm', 'm'.")
\ No newline at end of file
+import numpy as np
+
+# Factors scaling the supported length units to metres
+UNIT_SCALE_FACTORS = {'mm': 1e-3, 'cm': 1e-2, 'm': 1.0}
+
+
+def get_scale_factor(units):
+    """Return the factor scaling the units provided to metres."""
+    scale = UNIT_SCALE_FACTORS.get(units)
+    if scale is None:
+        raise ValueError(f"Units '{units}' not recognized. Supported units are 'mm', 'cm', 'm'.")
+    return scale
+
+
+def convert_units_array(values, units):
+    """Convert all values of an array at once based on the units provided, values in metres are returned as they are."""
+    scale = get_scale_factor(units)
+    return values if scale == 1.0 else np.multiply(values, scale)